@@ -1,8 +1,18 @@
 import os
 import re
+import gzip
+import mmap
 import logging
-from typing import List, Optional
-from pathlib import Path
+import itertools
+import collections
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,6 +26,29 @@ class VCFCleaner:
     - Les contacts sans numéro de téléphone
     """
     
+    __slots__ = ('fields_to_remove', 'essential_fields', 'stats')
+    
+    # Le fichier est traité en octets ; seule la valeur des lignes TEL est décodée,
+    # pour reconnaître les chiffres et espaces Unicode dans les numéros.
+    # Numéro de téléphone (après les deux points) et caractères de mise en forme à retirer
+    _TEL_RE = re.compile(r':([\d\s\-+()]+)')
+    # La table couvre les numéros ASCII ; l'expression retire aussi les espaces
+    # Unicode (ex. : espace insécable U+00A0 ou U+202F entre les groupes de chiffres)
+    _STRIP_TABLE = str.maketrans('', '', ' \t\r\n\v\f-()')
+    _STRIP_RE = re.compile(r'[\s\-()]')
+    
+    # Taille à partir de laquelle les contacts accumulés sont écrits sur disque
+    _WRITE_BUFFER_SIZE = 4 << 20
+    
+    # Catégories de champ, mémorisées par nom de champ brut dans _iter_contacts
+    _FIELD_KEEP, _FIELD_REMOVE, _FIELD_TEL, _FIELD_FN = range(4)
+    _FIELD_CACHE_MAX = 1024
+    
+    # Mode parallèle (sur demande, via workers) : taille de fichier minimale
+    # et taille visée de chaque morceau
+    _PARALLEL_MIN_SIZE = 64 << 20
+    _PARALLEL_CHUNK_SIZE = 8 << 20
+    
     def __init__(self):
         # Champs à supprimer (préfixes)
         self.fields_to_remove = [
@@ -38,213 +71,343 @@ class VCFCleaner:
             'blocks_removed': 0
         }
     
-    def _should_remove_field(self, line: str) -> bool:
+    def _reset_stats(self):
         """
-        Détermine si une ligne doit être supprimée
+        Remet les statistiques à zéro avant un nouveau nettoyage
         """
-        line_upper = line.upper()
-        
-        # Vérifie si la ligne commence par un champ à supprimer
-        for field in self.fields_to_remove:
-            if line_upper.startswith(field + ':') or line_upper.startswith(field + ';'):
-                return True
-        return False
+        self.stats = dict.fromkeys(self.stats, 0)
     
-    def _extract_contact_info(self, contact_lines: List[str]) -> dict:
+    def _remove_set(self) -> frozenset:
         """
-        Extrait les informations essentielles d'un contact
+        Noms canoniques (majuscules, en octets) des champs à supprimer, pour une
+        recherche en O(1) par ligne ; dérivés de fields_to_remove à chaque nettoyage
         """
-        info = {'name': '', 'phones': [], 'emails': []}
-        
-        for line in contact_lines:
-            line_upper = line.upper()
-            if line_upper.startswith('FN:'):
-                info['name'] = line[3:].strip()
-            elif line_upper.startswith('TEL'):
-                # Extrait le numéro de téléphone (après les deux points)
-                tel_match = re.search(r':([\d\s\-\+\(\)]+)', line)
-                if tel_match:
-                    phone = re.sub(r'[\s\-\(\)]', '', tel_match.group(1))
-                    if phone:
-                        info['phones'].append(phone)
-            elif line_upper.startswith('EMAIL'):
-                email_match = re.search(r':(.+)', line)
-                if email_match:
-                    info['emails'].append(email_match.group(1).strip())
-        
-        return info
+        return frozenset(field.upper().encode('utf-8') for field in self.fields_to_remove)
     
-    def _is_duplicate(self, contact1: dict, contact2: dict) -> bool:
+    def _classify_field(self, tag: bytes, remove_set: frozenset) -> int:
         """
-        Détermine si deux contacts sont des doublons
+        Détermine la catégorie d'un champ à partir de son nom (avant ':' ou ';')
         """
-        # Comparaison par nom (en ignorant la casse)
-        if contact1['name'] and contact2['name']:
-            if contact1['name'].lower() == contact2['name'].lower():
-                return True
-        
-        # Comparaison par numéro de téléphone
-        for phone1 in contact1['phones']:
-            for phone2 in contact2['phones']:
-                # Compare les derniers 8 chiffres (pour gérer les préfixes internationaux)
-                if len(phone1) >= 8 and len(phone2) >= 8:
-                    if phone1[-8:] == phone2[-8:]:
-                        return True
-        
-        return False
+        tag = tag.upper()
+        if tag in remove_set:
+            return self._FIELD_REMOVE
+        if tag.startswith(b'TEL'):
+            return self._FIELD_TEL
+        if tag == b'FN':
+            return self._FIELD_FN
+        return self._FIELD_KEEP
     
-    def _parse_vcf_contacts(self, lines: List[str]) -> List[List[str]]:
+    def _iter_contacts(self, lines: Iterable[bytes]) -> Iterator[Tuple[str, Tuple[str, ...], bytes]]:
         """
-        Parse le fichier VCF et retourne une liste de contacts
+        Parse et nettoie les contacts en une seule passe, en ne gardant que le
+        contact en cours en mémoire. Produit (nom, suffixes de téléphone, contenu)
+        pour chaque contact ayant un numéro de téléphone, dans l'ordre du fichier
         """
-        contacts = []
-        current_contact = []
+        # Accès fréquents liés en variables locales (évite les recherches d'attributs par ligne)
+        classify_field = self._classify_field
+        remove_set = self._remove_set()
+        tel_search = self._TEL_RE.search
+        strip_table = self._STRIP_TABLE
+        strip_sub = self._STRIP_RE.sub
+        
+        # Compteurs locaux, reportés dans self.stats en fin de traitement
+        total_contacts = 0
+        contacts_with_phone = 0
+        contacts_removed = 0
+        total_blocks_removed = 0
+        
+        # Les fichiers n'utilisent que quelques dizaines de noms de champ distincts :
+        # la catégorie de chacun n'est calculée qu'une fois (cache borné)
+        field_kinds = {}
+        cache_max = self._FIELD_CACHE_MAX
+        FIELD_REMOVE, FIELD_TEL, FIELD_FN = self._FIELD_REMOVE, self._FIELD_TEL, self._FIELD_FN
+        
+        # État du contact en cours
+        block = []
         in_vcard = False
+        skip_until_next_field = False
+        has_phone = False
+        block_name = b''
+        phone_suffixes = []
+        blocks_removed = 0
         
         for line in lines:
             line_stripped = line.strip()
             
-            if line_stripped.startswith('BEGIN:VCARD'):
-                current_contact = [line]
+            if line_stripped.startswith(b'BEGIN:VCARD'):
+                # Les listes sont réutilisées d'un contact à l'autre plutôt que recréées
+                block.clear()
+                block.append(line)
                 in_vcard = True
-            elif line_stripped.startswith('END:VCARD'):
-                current_contact.append(line)
-                if in_vcard:
-                    contacts.append(current_contact)
-                current_contact = []
+                skip_until_next_field = False
+                has_phone = False
+                block_name = b''
+                phone_suffixes.clear()
+                blocks_removed = 0
+            elif line_stripped.startswith(b'END:VCARD'):
+                if not in_vcard:
+                    continue
                 in_vcard = False
+                block.append(line)
+                total_contacts += 1
+                total_blocks_removed += blocks_removed
+                
+                # Conserve le contact seulement s'il a un numéro de téléphone
+                if not has_phone:
+                    contacts_removed += 1
+                    continue
+                contacts_with_phone += 1
+                
+                # Seul le nom est décodé, pour une comparaison insensible à la casse
+                name = block_name.decode('utf-8', errors='replace').lower()
+                yield name, tuple(phone_suffixes), b''.join(block)
             elif in_vcard:
-                current_contact.append(line)
+                # Gestion des blocs multilignes (comme PHOTO)
+                if skip_until_next_field:
+                    # Continue à ignorer jusqu'à trouver une nouvelle propriété
+                    if b':' in line_stripped and not line_stripped.startswith(b' '):
+                        skip_until_next_field = False
+                    else:
+                        blocks_removed += 1
+                        continue
+                
+                # Découpage unique de la ligne, réutilisé pour toutes les extractions :
+                # nom du champ (avant ':' ou ';'), puis sa catégorie
+                head, _, value = line_stripped.partition(b':')
+                tag = head.partition(b';')[0]
+                kind = field_kinds.get(tag)
+                if kind is None:
+                    kind = classify_field(tag, remove_set)
+                    if len(field_kinds) < cache_max:
+                        field_kinds[tag] = kind
+                
+                # Vérifie si c'est un champ à supprimer
+                if kind == FIELD_REMOVE:
+                    skip_until_next_field = True
+                    blocks_removed += 1
+                    continue
+                
+                # Vérifie la présence d'un téléphone, puis relève le nom et les
+                # numéros pour la détection des doublons
+                if kind == FIELD_TEL:
+                    has_phone = True
+                    # Extrait le numéro de téléphone (après les deux points) ;
+                    # seule la fin de ligne, à partir du premier ':', est décodée
+                    tel_value = line_stripped[len(head):].decode('utf-8', errors='replace')
+                    tel_match = tel_search(tel_value)
+                    if tel_match:
+                        phone = tel_match.group(1)
+                        phone = phone.translate(strip_table) if phone.isascii() else strip_sub('', phone)
+                        # Seuls les derniers 8 chiffres servent à la comparaison
+                        # (pour gérer les préfixes internationaux)
+                        if len(phone) >= 8:
+                            phone_suffixes.append(phone[-8:])
+                elif kind == FIELD_FN:
+                    block_name = value.strip()
+                
+                block.append(line)
         
-        return contacts
+        stats = self.stats
+        stats['total_contacts'] += total_contacts
+        stats['contacts_with_phone'] += contacts_with_phone
+        stats['contacts_removed'] += contacts_removed
+        stats['blocks_removed'] += total_blocks_removed
     
-    def _clean_contact(self, contact_lines: List[str]) -> Optional[List[str]]:
+    def _iter_unique_contacts(self, contacts: Iterable[Tuple[str, Tuple[str, ...], bytes]]) -> Iterator[bytes]:
         """
-        Nettoie un contact individuel
+        Produit le contenu des contacts qui ne sont pas des doublons d'un contact déjà conservé
         """
-        cleaned_lines = []
-        has_phone = False
-        skip_until_next_field = False
+        seen_names = set()
+        seen_phone_suffixes = set()
+        duplicates_removed = 0
         
-        for line in contact_lines:
-            line_stripped = line.strip()
-            
-            # Gestion des blocs multilignes (comme PHOTO)
-            if skip_until_next_field:
-                # Continue à ignorer jusqu'à trouver une nouvelle propriété
-                if ':' in line_stripped and not line_stripped.startswith(' '):
-                    skip_until_next_field = False
-                else:
-                    self.stats['blocks_removed'] += 1
-                    continue
-            
-            # Vérifie si c'est un champ à supprimer
-            if self._should_remove_field(line_stripped):
-                skip_until_next_field = True
-                self.stats['blocks_removed'] += 1
+        for name, phone_suffixes, data in contacts:
+            # Vérifie si c'est un doublon (par nom en ignorant la casse, ou par téléphone)
+            if (name and name in seen_names) or not seen_phone_suffixes.isdisjoint(phone_suffixes):
+                duplicates_removed += 1
                 continue
             
-            # Vérifie la présence d'un téléphone
-            if line_stripped.upper().startswith('TEL'):
-                has_phone = True
-            
-            cleaned_lines.append(line)
+            if name:
+                seen_names.add(name)
+            seen_phone_suffixes.update(phone_suffixes)
+            yield data
         
-        # Retourne le contact seulement s'il a un numéro de téléphone
-        if has_phone:
-            self.stats['contacts_with_phone'] += 1
-            return cleaned_lines
-        else:
-            self.stats['contacts_removed'] += 1
-            return None
+        self.stats['duplicates_removed'] += duplicates_removed
     
-    def _remove_duplicates(self, contacts: List[List[str]]) -> List[List[str]]:
+    def _iter_parallel_contacts(self, input_path: str, mm: mmap.mmap, workers: int) -> Iterator[Tuple[str, Tuple[str, ...], bytes]]:
         """
-        Supprime les contacts en double
+        Nettoie le fichier par morceaux dans plusieurs processus et produit les
+        contacts dans l'ordre du fichier, pour un dédoublonnage identique au
+        traitement séquentiel
         """
-        unique_contacts = []
-        contact_infos = []
+        chunks = _split_on_begin_vcard(mm, self._PARALLEL_CHUNK_SIZE)
+        logger.info("Traitement parallèle : %d morceaux sur %d processus", len(chunks), workers)
         
-        for contact in contacts:
-            info = self._extract_contact_info(contact)
-            
-            # Vérifie si c'est un doublon
-            is_duplicate = False
-            for existing_info in contact_infos:
-                if self._is_duplicate(info, existing_info):
-                    is_duplicate = True
-                    self.stats['duplicates_removed'] += 1
-                    break
+        # Au plus 2 morceaux en cours par processus : la mémoire utilisée reste
+        # bornée par la taille des morceaux, pas par celle du fichier
+        remaining = iter(chunks)
+        max_pending = 2 * workers
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Le nettoyeur lui-même est transmis : sa classe et sa configuration
+            # (ex. : fields_to_remove modifié) s'appliquent aussi dans les processus
+            pending = collections.deque(
+                executor.submit(_clean_chunk, self, input_path, start, end)
+                for start, end in itertools.islice(remaining, max_pending)
+            )
+            try:
+                # Un échec de lancement des processus apparaît dès le premier résultat
+                pending[0].result()
+            except Exception as e:
+                logger.warning("Traitement parallèle impossible (%s), passage en séquentiel", e)
+                for future in pending:
+                    future.cancel()
+                pending = None
             
-            if not is_duplicate:
-                unique_contacts.append(contact)
-                contact_infos.append(info)
+            if pending is not None:
+                # Les résultats sont consommés dans l'ordre des morceaux
+                while pending:
+                    contacts, chunk_stats = pending.popleft().result()
+                    for start, end in itertools.islice(remaining, 1):
+                        pending.append(executor.submit(_clean_chunk, self, input_path, start, end))
+                    for key, value in chunk_stats.items():
+                        self.stats[key] += value
+                    yield from contacts
+                return
+        
+        # Repli sur le traitement séquentiel : aucun contact n'a encore été produit
+        yield from self._iter_contacts(_iter_lines(mm, universal_newlines=False))
+    
+    def iter_clean_vcards(self, input_path: str, workers: Optional[int] = 1) -> Iterator[bytes]:
+        """
+        Produit, dans l'ordre du fichier, le contenu (en octets) de chaque contact
+        nettoyé et non dupliqué, sans écrire de fichier intermédiaire.
+        
+        workers > 1 (ou None : un processus par cœur) active le traitement
+        parallèle des fichiers volumineux ; le script appelant doit alors
+        protéger son code par `if __name__ == "__main__":`
+        """
+        input_path = os.fspath(input_path)
+        # Les statistiques décrivent uniquement ce nettoyage (nettoyeur réutilisable)
+        self._reset_stats()
+        
+        # Lecture en octets via mmap : pas de décodage, le système charge les pages à la demande.
+        # Les lignes conservées sont recopiées telles quelles, sans ré-encodage.
+        with open(input_path, 'rb') as f_in:
+            # mmap refuse les fichiers vides
+            if not os.fstat(f_in.fileno()).st_size:
+                return
+            with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Les fichiers à fins de ligne CR seules (anciens Mac) sont traités
+                # en séquentiel, le découpage en morceaux s'appuyant sur '\n'
+                universal_newlines = _has_lone_cr(mm)
+                if workers is None:
+                    workers = os.cpu_count() or 1
+                # Jamais de nouveaux processus depuis un processus fils (ex. : script
+                # sans garde __main__ ré-exécuté au démarrage d'un processus)
+                if (workers > 1 and len(mm) >= self._PARALLEL_MIN_SIZE and not universal_newlines
+                        and multiprocessing.parent_process() is None):
+                    contacts = self._iter_parallel_contacts(input_path, mm, workers)
+                else:
+                    contacts = self._iter_contacts(_iter_lines(mm, universal_newlines))
+                yield from self._iter_unique_contacts(contacts)
+    
+    def _write_vcards(self, vcards: Iterable[bytes], f_out: BinaryIO):
+        """
+        Écrit les contacts par lots pour limiter le nombre d'appels d'écriture
+        """
+        out_buf = bytearray()
+        write_buffer_size = self._WRITE_BUFFER_SIZE
+        
+        for data in vcards:
+            out_buf += data
+            if len(out_buf) >= write_buffer_size:
+                f_out.write(out_buf)
+                out_buf.clear()
         
-        return unique_contacts
+        f_out.write(out_buf)
     
-    def nettoyer_vcf(self, input_path: str, output_path: str) -> bool:
+    @staticmethod
+    def _open_output(output_path: str) -> BinaryIO:
         """
-        Fonction principale pour nettoyer un fichier VCF
+        Ouvre le fichier de sortie, compressé selon son extension (.gz ou .zst)
         """
+        lower_path = output_path.lower()
+        if lower_path.endswith('.gz'):
+            return gzip.open(output_path, 'wb')
+        if lower_path.endswith('.zst'):
+            if zstandard is None:
+                raise RuntimeError("Le module zstandard est requis pour écrire un fichier .zst (pip install zstandard)")
+            # Le fichier n'est ouvert qu'une fois le compresseur construit, et refermé en cas d'échec
+            compressor = zstandard.ZstdCompressor(level=3)
+            raw_file = open(output_path, 'wb')
+            try:
+                return compressor.stream_writer(raw_file)
+            except Exception:
+                raw_file.close()
+                raise
+        return open(output_path, 'wb')
+    
+    def nettoyer_vcf(self, input_path: str, output_path: str, workers: Optional[int] = 1) -> bool:
+        """
+        Fonction principale pour nettoyer un fichier VCF (workers : voir iter_clean_vcards)
+        """
+        output_created = False
+        self._reset_stats()
         try:
-            # Validation des chemins
-            input_file = Path(input_path)
-            output_file = Path(output_path)
+            # Validation des chemins (chaînes simples, sans objets Path)
+            input_path = os.fspath(input_path)
+            output_path = os.fspath(output_path)
             
-            if not input_file.exists():
-                logger.error(f"Le fichier d'entrée n'existe pas : {input_path}")
+            if not os.path.exists(input_path):
+                logger.error("Le fichier d'entrée n'existe pas : %s", input_path)
                 return False
             
-            if not input_file.suffix.lower() == '.vcf':
-                logger.warning(f"Le fichier n'a pas l'extension .vcf : {input_path}")
+            if not input_path.lower().endswith('.vcf'):
+                logger.warning("Le fichier n'a pas l'extension .vcf : %s", input_path)
             
             # Création du dossier de sortie si nécessaire
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
             
-            logger.info(f"Début du nettoyage de {input_path}")
+            logger.info("Début du nettoyage de %s", input_path)
             
-            # Lecture du fichier avec gestion d'erreurs d'encodage
-            try:
-                with open(input_path, 'r', encoding='utf-8', errors='replace') as f:
-                    lines = f.readlines()
-            except UnicodeDecodeError:
-                logger.warning("Erreur d'encodage UTF-8, tentative avec latin-1")
-                with open(input_path, 'r', encoding='latin-1', errors='replace') as f:
-                    lines = f.readlines()
+            # Nettoyage en flux : chaque contact conservé est écrit (et compressé si besoin) au fil de l'eau
+            with self._open_output(output_path) as f_out:
+                output_created = True
+                self._write_vcards(self.iter_clean_vcards(input_path, workers), f_out)
             
-            # Parse des contacts
-            contacts = self._parse_vcf_contacts(lines)
-            self.stats['total_contacts'] = len(contacts)
-            logger.info(f"Nombre de contacts trouvés : {len(contacts)}")
+            logger.info("Nombre de contacts trouvés : %d", self.stats['total_contacts'])
             
-            if not contacts:
+            if not self.stats['total_contacts']:
                 logger.warning("Aucun contact trouvé dans le fichier")
+                self._remove_output(output_path)
                 return False
             
-            # Nettoyage des contacts
-            cleaned_contacts = []
-            for contact in contacts:
-                cleaned_contact = self._clean_contact(contact)
-                if cleaned_contact:
-                    cleaned_contacts.append(cleaned_contact)
-            
-            # Suppression des doublons
-            final_contacts = self._remove_duplicates(cleaned_contacts)
-            
-            # Écriture du fichier nettoyé
-            with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                for contact in final_contacts:
-                    f.writelines(contact)
-            
-            # Affichage des statistiques
-            self._print_stats(output_path)
+            # Affichage des statistiques (ignoré si le niveau de log INFO est désactivé)
+            if logger.isEnabledFor(logging.INFO):
+                self._print_stats(output_path)
             
             return True
             
         except Exception as e:
-            logger.error(f"Erreur lors du nettoyage : {str(e)}")
+            logger.error("Erreur lors du nettoyage : %s", e)
+            # Pas de fichier de sortie partiel ou vide en cas d'échec
+            if output_created:
+                self._remove_output(output_path)
             return False
     
+    @staticmethod
+    def _remove_output(output_path: str):
+        """
+        Supprime le fichier de sortie créé par un nettoyage qui n'a pas abouti
+        """
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+    
     def _print_stats(self, output_path: str):
         """
         Affiche les statistiques du nettoyage
@@ -265,13 +428,93 @@ class VCFCleaner:
         print(f"Fichier nettoyé créé : {output_path}")
 
 
+# Une ligne terminée par CRLF, CR ou LF, ou la dernière ligne sans fin de ligne
+_UNIVERSAL_LINE_RE = re.compile(rb'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+')
+
+
+# Taille du début de fichier examiné pour détecter les fins de ligne CR seules
+_NEWLINE_PROBE_SIZE = 64 << 10
+
+
+def _has_lone_cr(mm: mmap.mmap) -> bool:
+    """
+    Indique si le fichier utilise des fins de ligne CR seules : un CR non suivi
+    de LF dans les premiers octets du fichier (recherche bornée, sans copie)
+    """
+    end = min(len(mm), _NEWLINE_PROBE_SIZE)
+    pos = mm.find(b'\r', 0, end)
+    while pos >= 0:
+        if mm[pos + 1:pos + 2] != b'\n':
+            return True
+        pos = mm.find(b'\r', pos + 2, end)
+    return False
+
+
+def _iter_lines(mm: mmap.mmap, universal_newlines: bool) -> Iterator[bytes]:
+    """
+    Itère sur les lignes du fichier, fins de ligne comprises. Par défaut seul
+    '\n' termine une ligne (le plus rapide) ; en mode universel, CR seul aussi
+    """
+    if universal_newlines:
+        return (match.group() for match in _UNIVERSAL_LINE_RE.finditer(mm))
+    return iter(mm.readline, b'')
+
+
+def _split_on_begin_vcard(mm: mmap.mmap, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Découpe le fichier en plages d'environ chunk_size octets commençant chacune
+    sur une ligne BEGIN:VCARD
+    """
+    size = len(mm)
+    bounds = [0]
+    while True:
+        # Recherche à partir de la taille visée, sans revenir en arrière
+        pos = mm.find(b'\nBEGIN:VCARD', bounds[-1] + chunk_size - 1)
+        if pos < 0:
+            break
+        bounds.append(pos + 1)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _iter_range_lines(mm: mmap.mmap, start: int, end: int) -> Iterator[bytes]:
+    """
+    Itère sur les lignes d'une plage d'octets (qui se termine sur une fin de ligne)
+    """
+    mm.seek(start)
+    readline = mm.readline
+    tell = mm.tell
+    while tell() < end:
+        yield readline()
+
+
+def _clean_chunk(cleaner: VCFCleaner, input_path: str, start: int, end: int) -> Tuple[list, Dict[str, int]]:
+    """
+    Nettoie une plage d'octets du fichier (exécuté dans un processus séparé, avec
+    une copie du nettoyeur appelant) et retourne les contacts avec téléphone,
+    sans dédoublonnage, et les statistiques de cette plage
+    """
+    cleaner.stats = dict.fromkeys(cleaner.stats, 0)
+    with open(input_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            contacts = list(cleaner._iter_contacts(_iter_range_lines(mm, start, end)))
+    return contacts, cleaner.stats
+
+
 # Fonction utilitaire pour compatibilité avec le code original
-def nettoyer_vcf(input_path: str, output_path: str) -> bool:
+def nettoyer_vcf(input_path: str, output_path: str, workers: Optional[int] = 1) -> bool:
     """
     Fonction de compatibilité avec l'API originale
     """
     cleaner = VCFCleaner()
-    return cleaner.nettoyer_vcf(input_path, output_path)
+    return cleaner.nettoyer_vcf(input_path, output_path, workers)
+
+
+def iter_clean_vcards(input_path: str, workers: Optional[int] = 1) -> Iterator[bytes]:
+    """
+    Produit les contacts nettoyés (en octets), par exemple pour les envoyer vers un flux compressé
+    """
+    return VCFCleaner().iter_clean_vcards(input_path, workers)
 
 
 # Exemple d'utilisation
@@ -0,0 +1,291 @@
+import gzip
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Le script porte un nom avec un tiret : il est chargé à partir de son chemin.
+# Il est enregistré dans sys.modules pour que les processus du mode parallèle
+# puissent retrouver ses fonctions.
+_spec = importlib.util.spec_from_file_location('vcf_cleaner', ROOT / 'VCF-Cleaner.py')
+vcf_cleaner = importlib.util.module_from_spec(_spec)
+sys.modules['vcf_cleaner'] = vcf_cleaner
+_spec.loader.exec_module(vcf_cleaner)
+
+
+def vcard(*fields, newline='\r\n'):
+    """
+    Construit un contact VCF à partir de ses lignes de champ
+    """
+    return newline.join(('BEGIN:VCARD',) + fields + ('END:VCARD',)) + newline
+
+
+def clean(tmp_path, content, cleaner=None, name='contacts.vcf', workers=1):
+    """
+    Nettoie le contenu donné et retourne (résultat, statistiques, fichier de sortie)
+    """
+    input_path = tmp_path / name
+    input_path.write_bytes(content.encode('utf-8'))
+    output_path = tmp_path / 'sortie.vcf'
+    cleaner = cleaner or vcf_cleaner.VCFCleaner()
+    result = cleaner.nettoyer_vcf(str(input_path), str(output_path), workers=workers)
+    return result, cleaner.stats, output_path
+
+
+def test_input_without_vcard_writes_no_output(tmp_path):
+    result, stats, output_path = clean(tmp_path, 'pas de contact ici\r\n')
+
+    assert result is False
+    assert stats['total_contacts'] == 0
+    assert not output_path.exists()
+
+
+def test_removes_unwanted_fields_and_contacts_without_phone(tmp_path):
+    content = (
+        vcard('VERSION:3.0', 'FN:Alice', 'TEL:0612345678',
+              'PHOTO;ENCODING=b:AAAA', ' BBBB', 'EMAIL:alice@example.com')
+        + vcard('FN:Bob', 'EMAIL:bob@example.com')
+    )
+
+    result, stats, output_path = clean(tmp_path, content)
+
+    assert result is True
+    assert output_path.read_bytes() == vcard(
+        'FN:Alice', 'TEL:0612345678', 'EMAIL:alice@example.com').encode('utf-8')
+    assert stats['contacts_with_phone'] == 1
+    assert stats['contacts_removed'] == 1
+
+
+def test_duplicates_by_name_and_phone_suffix(tmp_path):
+    content = (
+        vcard('FN:Alice', 'TEL:0612345678')
+        + vcard('FN:alice', 'TEL:0700000000')
+        + vcard('FN:Bob', 'TEL:+33 6 12 34 56 78')
+    )
+
+    _, stats, output_path = clean(tmp_path, content)
+
+    assert stats['duplicates_removed'] == 2
+    assert output_path.read_bytes() == vcard('FN:Alice', 'TEL:0612345678').encode('utf-8')
+
+
+def test_fields_to_remove_can_be_changed_after_init(tmp_path):
+    cleaner = vcf_cleaner.VCFCleaner()
+    cleaner.fields_to_remove.append('EMAIL')
+    cleaner.fields_to_remove.remove('NOTE')
+
+    _, _, output_path = clean(
+        tmp_path, vcard('FN:Alice', 'TEL:0612345678', 'EMAIL:alice@example.com', 'NOTE:garder'), cleaner)
+
+    assert output_path.read_bytes() == vcard('FN:Alice', 'TEL:0612345678', 'NOTE:garder').encode('utf-8')
+
+
+def test_duplicates_with_non_ascii_digits(tmp_path):
+    content = vcard('TEL:٠٦١٢٣٤٥٦٧٨') + vcard('TEL:٠٦١٢٣٤٥٦٧٨')
+
+    _, stats, _ = clean(tmp_path, content)
+
+    assert stats['duplicates_removed'] == 1
+
+
+@pytest.mark.parametrize('separator', ['\u00a0', '\u202f'])
+def test_duplicates_with_non_breaking_space_separators(tmp_path, separator):
+    content = (
+        vcard('TEL:' + separator.join(['06', '12', '34', '56', '78']))
+        + vcard('TEL:0612345678')
+    )
+
+    _, stats, _ = clean(tmp_path, content)
+
+    assert stats['duplicates_removed'] == 1
+
+
+@pytest.mark.parametrize('tel_field', ['TEL', 'tel', 'Tel', 'tEL'])
+def test_phone_field_detection_is_case_insensitive(tmp_path, tel_field):
+    content = vcard('FN:Alice', tel_field + ':0612345678')
+
+    _, stats, output_path = clean(tmp_path, content)
+
+    assert stats['contacts_with_phone'] == 1
+    assert output_path.read_bytes() == content.encode('utf-8')
+
+
+@pytest.mark.parametrize('newline', ['\r\n', '\n', '\r'])
+def test_line_endings(tmp_path, newline):
+    content = (
+        vcard('FN:Alice', 'NOTE:a supprimer', 'TEL:0612345678', newline=newline)
+        + vcard('FN:Alice', 'TEL:0700000000', newline=newline)
+    )
+
+    result, stats, output_path = clean(tmp_path, content)
+
+    assert result is True
+    assert stats['total_contacts'] == 2
+    assert stats['duplicates_removed'] == 1
+    assert output_path.read_bytes() == vcard('FN:Alice', 'TEL:0612345678', newline=newline).encode('utf-8')
+
+
+def parallel_test_content():
+    """
+    Contenu assez varié pour répartir doublons et suppressions sur plusieurs morceaux
+    """
+    return ''.join(
+        vcard('FN:Contact %d' % (i % 70), 'TEL:06 12 34 %02d %02d' % (i % 90, i % 13),
+              'NOTE:a supprimer', 'EMAIL:c%d@example.com' % i)
+        for i in range(300)
+    ) + vcard('FN:Sans telephone')
+
+
+def test_parallel_path_matches_sequential_path(tmp_path, monkeypatch, caplog):
+    content = parallel_test_content()
+
+    def configured_cleaner():
+        cleaner = vcf_cleaner.VCFCleaner()
+        cleaner.fields_to_remove.append('EMAIL')
+        return cleaner
+
+    sequential = configured_cleaner()
+    _, sequential_stats, sequential_output = clean(tmp_path, content, sequential)
+    expected = sequential_output.read_bytes()
+
+    monkeypatch.setattr(vcf_cleaner.VCFCleaner, '_PARALLEL_MIN_SIZE', 1)
+    # Des morceaux plus nombreux que la file d'attente (2 par processus)
+    monkeypatch.setattr(vcf_cleaner.VCFCleaner, '_PARALLEL_CHUNK_SIZE', 1000)
+    with caplog.at_level('INFO'):
+        result, parallel_stats, parallel_output = clean(tmp_path, content, configured_cleaner(), workers=2)
+
+    assert 'Traitement parallèle :' in caplog.text
+    assert 'impossible' not in caplog.text
+    assert result is True
+    assert parallel_output.read_bytes() == expected
+    assert b'EMAIL' not in expected
+    assert parallel_stats == sequential_stats
+
+
+def test_reused_cleaner_reports_each_run_separately(tmp_path):
+    cleaner = vcf_cleaner.VCFCleaner()
+    first_result, first_stats, _ = clean(tmp_path, vcard('FN:Alice', 'TEL:0612345678'), cleaner, name='a.vcf')
+    assert first_result is True
+    assert first_stats['total_contacts'] == 1
+
+    result, stats, output_path = clean(tmp_path, 'pas de contact ici\r\n', cleaner, name='b.vcf')
+
+    assert result is False
+    assert stats['total_contacts'] == 0
+    assert stats['contacts_with_phone'] == 0
+    assert not output_path.exists()
+
+
+def test_lone_cr_detection_is_not_limited_to_first_line(tmp_path):
+    content = vcard('FN:Alice', 'TEL:0612345678', newline='\n') + vcard('FN:Bob', 'TEL:0700000000', newline='\r')
+
+    _, stats, _ = clean(tmp_path, content)
+
+    assert stats['total_contacts'] == 2
+
+
+class _NoProcessPool:
+    def __init__(self, *args, **kwargs):
+        raise AssertionError('aucun processus ne doit être lancé')
+
+
+def test_default_path_never_starts_processes(tmp_path, monkeypatch):
+    content = parallel_test_content()
+    _, _, sequential_output = clean(tmp_path, content)
+    expected = sequential_output.read_bytes()
+
+    monkeypatch.setattr(vcf_cleaner.VCFCleaner, '_PARALLEL_MIN_SIZE', 1)
+    monkeypatch.setattr(vcf_cleaner, 'ProcessPoolExecutor', _NoProcessPool)
+
+    result, _, output_path = clean(tmp_path, content)
+
+    assert result is True
+    assert output_path.read_bytes() == expected
+
+
+def test_child_process_never_starts_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(vcf_cleaner.VCFCleaner, '_PARALLEL_MIN_SIZE', 1)
+    monkeypatch.setattr(vcf_cleaner, 'ProcessPoolExecutor', _NoProcessPool)
+    monkeypatch.setattr(vcf_cleaner.multiprocessing, 'parent_process', lambda: object())
+
+    result, stats, _ = clean(tmp_path, parallel_test_content(), workers=4)
+
+    assert result is True
+    assert stats['total_contacts'] == 301
+
+
+API_CONTENT = (
+    vcard('FN:Alice', 'TEL:0612345678', 'NOTE:a supprimer')
+    + vcard('FN:alice', 'TEL:0700000000')
+    + vcard('FN:Bob', 'TEL:0711111111')
+)
+API_EXPECTED = [
+    vcard('FN:Alice', 'TEL:0612345678').encode('utf-8'),
+    vcard('FN:Bob', 'TEL:0711111111').encode('utf-8'),
+]
+
+
+def test_iter_clean_vcards_method(tmp_path):
+    input_path = tmp_path / 'contacts.vcf'
+    input_path.write_bytes(API_CONTENT.encode('utf-8'))
+    cleaner = vcf_cleaner.VCFCleaner()
+
+    assert list(cleaner.iter_clean_vcards(str(input_path))) == API_EXPECTED
+    assert cleaner.stats['duplicates_removed'] == 1
+
+
+def test_iter_clean_vcards_function(tmp_path):
+    input_path = tmp_path / 'contacts.vcf'
+    input_path.write_bytes(API_CONTENT.encode('utf-8'))
+
+    assert list(vcf_cleaner.iter_clean_vcards(input_path)) == API_EXPECTED
+
+
+def test_gzip_output(tmp_path):
+    input_path = tmp_path / 'contacts.vcf'
+    input_path.write_bytes(API_CONTENT.encode('utf-8'))
+    output_path = tmp_path / 'sortie.vcf.gz'
+
+    assert vcf_cleaner.nettoyer_vcf(str(input_path), str(output_path)) is True
+    assert gzip.decompress(output_path.read_bytes()) == b''.join(API_EXPECTED)
+
+
+def test_zstandard_output(tmp_path):
+    zstandard = pytest.importorskip('zstandard')
+    input_path = tmp_path / 'contacts.vcf'
+    input_path.write_bytes(API_CONTENT.encode('utf-8'))
+    output_path = tmp_path / 'sortie.vcf.zst'
+
+    assert vcf_cleaner.nettoyer_vcf(str(input_path), str(output_path)) is True
+    with zstandard.ZstdDecompressor().stream_reader(output_path.open('rb')) as reader:
+        assert reader.read() == b''.join(API_EXPECTED)
+
+
+def test_zstandard_output_without_module(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(vcf_cleaner, 'zstandard', None)
+    input_path = tmp_path / 'contacts.vcf'
+    input_path.write_bytes(API_CONTENT.encode('utf-8'))
+    output_path = tmp_path / 'sortie.vcf.zst'
+
+    with pytest.raises(RuntimeError, match='zstandard'):
+        vcf_cleaner.VCFCleaner._open_output(str(output_path))
+    assert vcf_cleaner.nettoyer_vcf(str(input_path), str(output_path)) is False
+    assert 'zstandard' in caplog.text
+    assert not output_path.exists()
+
+
+def test_zstandard_compressor_failure_opens_no_file(tmp_path, monkeypatch):
+    class FailingZstandard:
+        @staticmethod
+        def ZstdCompressor(level):
+            raise ValueError('niveau invalide')
+
+    monkeypatch.setattr(vcf_cleaner, 'zstandard', FailingZstandard)
+    output_path = tmp_path / 'sortie.vcf.zst'
+
+    with pytest.raises(ValueError):
+        vcf_cleaner.VCFCleaner._open_output(str(output_path))
+    assert not output_path.exists()